@@ -7,11 +7,13 @@ import click
 
 from hyperfocus.console.exceptions import HyperfocusExit
 from hyperfocus.console.exceptions import TaskError
+from hyperfocus.database import database
 from hyperfocus.database.models import TaskStatus
 from hyperfocus.termui import formatter
 from hyperfocus.termui import printer
 from hyperfocus.termui import prompt
 from hyperfocus.termui import style
+from hyperfocus.termui.components import Notification
 from hyperfocus.termui.components import SuccessNotification
 from hyperfocus.termui.components import TasksTable
 from hyperfocus.termui.components import WarningNotification
@@ -26,6 +28,9 @@ if TYPE_CHECKING:
 class TaskCommands:
     def __init__(self, session: Session) -> None:
         self.session = session
+        # Tasks already displayed to the user, kept to avoid fetching again the
+        # picked task.
+        self._shown_tasks: dict[int, Task] = {}
 
     def show_tasks(self) -> None:
         tasks = self.session.daily_tracker.get_tasks()
@@ -34,6 +39,7 @@ class TaskCommands:
             printer.echo("No tasks for today...")
             raise HyperfocusExit()
 
+        self._shown_tasks = {task.id: task for task in tasks}
         printer.echo(TasksTable(tasks))
 
     def pick_task(self, prompt_text: str) -> int:
@@ -41,11 +47,23 @@ class TaskCommands:
         return cast(int, prompt.prompt(prompt_text, type=click.INT))
 
     def get_task(self, task_id: int) -> Task:
-        task = self.session.daily_tracker.get_task(task_id)
-        if not task:
-            raise TaskError(f"Task {task_id} does not exist.")
+        return self.get_tasks(task_ids=(task_id,))[task_id]
+
+    def get_tasks(self, task_ids: tuple[int, ...]) -> dict[int, Task]:
+        tasks = {
+            task_id: self._shown_tasks[task_id]
+            for task_id in task_ids
+            if task_id in self._shown_tasks
+        }
+        missing_task_ids = [task_id for task_id in task_ids if task_id not in tasks]
+        if missing_task_ids:
+            tasks.update(self.session.daily_tracker.get_tasks_by_ids(missing_task_ids))
 
-        return task
+        for task_id in task_ids:
+            if task_id not in tasks:
+                raise TaskError(f"Task {task_id} does not exist.")
+
+        return tasks
 
     def update_tasks(
         self, task_ids: tuple[int, ...], status: TaskStatus, prompt_text: str
@@ -54,25 +72,26 @@ class TaskCommands:
             task_id = self.pick_task(prompt_text=prompt_text)
             task_ids = (task_id,)
 
-        for task_id in task_ids:
-            task = self.get_task(task_id=task_id)
-
-            if task.status == status.value:
-                printer.echo(
-                    WarningNotification(
-                        f"{formatter.task(task=task, show_prefix=True)} unchanged."
-                    )
-                )
-                continue
-
-            self.session.daily_tracker.update_task(task=task, status=status)
-
-            text_suffix = "reset" if status == TaskStatus.TODO else status.name.lower()
-            printer.echo(
-                SuccessNotification(
-                    f"{formatter.task(task=task, show_prefix=True)} {text_suffix}."
-                )
-            )
+        tasks = self.get_tasks(task_ids=task_ids)
+        text_suffix = "reset" if status == TaskStatus.TODO else status.name.lower()
+        notifications: list[Notification] = []
+        with database.atomic():
+            for task_id in task_ids:
+                task = tasks[task_id]
+
+                if task.status == status.value:
+                    task_text = formatter.task(task=task, show_prefix=True)
+                    notifications.append(WarningNotification(f"{task_text} unchanged."))
+                    continue
+
+                self.session.daily_tracker.update_task(task=task, status=status)
+
+                task_text = formatter.task(task=task, show_prefix=True)
+                notifications.append(SuccessNotification(f"{task_text} {text_suffix}."))
+
+        printer.echo(
+            "\n".join(notification.resolve() for notification in notifications)
+        )
 
 
 class TasksReviewer:
@@ -5,7 +5,6 @@ import click
 from hyperfocus.console.commands._shortcodes import TaskCommands
 from hyperfocus.console.core.group import DefaultCommandGroup
 from hyperfocus.console.exceptions import HyperfocusExit
-from hyperfocus.console.exceptions import TaskError
 from hyperfocus.services.session import get_current_session
 from hyperfocus.services.stash_box import StashBox
 from hyperfocus.termui import formatter
@@ -36,10 +35,7 @@ def push(task_ids: tuple[int, ...] | None) -> None:
         task_ids = (task_id,)
 
     for task_id in task_ids:
-        task = session.daily_tracker.get_task(task_id)
-        if not task:
-            raise TaskError(f"Task {task_id} does not exist.")
-
+        task = task_cmd.get_task(task_id=task_id)
         stash_box.add(task)
 
         printer.echo(
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+from typing import ContextManager
 from typing import Type
 
 from peewee import Model
@@ -24,5 +26,11 @@ class Database:
         with self._engine:
             self._engine.create_tables(models=models)
 
+    def atomic(self) -> ContextManager[Any]:
+        """
+        Group every query run inside the context into a single transaction.
+        """
+        return self._engine.atomic()  # type: ignore[no-any-return]
+
     def close(self) -> None:
         self._engine.close()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime
 
+from typing import Iterable
 from typing import List
 from typing import cast
 
@@ -116,18 +117,16 @@ class DailyTracker:
 
         return task
 
-    def get_task(self, task_id: int) -> Task | None:
+    def get_tasks_by_ids(self, task_ids: Iterable[int]) -> dict[int, Task]:
         """
-        Retrieve a task by id from the working day.
+        Retrieve several tasks by id from the working day in a single query.
         """
-        task = Task.get_or_none(
-            Task.id == task_id, Task.working_day == self._working_day
+        query = Task.select()
+        query = query.where(
+            Task.id.in_(list(task_ids)), Task.working_day == self._working_day
         )
 
-        if task is not None:
-            return cast(Task, task)
-
-        return None
+        return {task.id: task for task in query.execute()}
 
     def get_tasks(self, exclude: list[TaskStatus] | None = None) -> list[Task]:
         """
@@ -3,14 +3,17 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from typing import Generator
 
+from peewee import prefetch
+
 from hyperfocus.database.models import Task
 from hyperfocus.database.models import WorkingDay
-from hyperfocus.services.daily_tracker import DailyTracker
 
 
 if TYPE_CHECKING:
     import datetime
 
+    from hyperfocus.services.daily_tracker import DailyTracker
+
 
 class History:
     """
@@ -29,11 +32,12 @@ class History:
         query = WorkingDay.select()
         query = query.where(WorkingDay.date < self.start)
         query = query.order_by(WorkingDay.date.desc())
-        previous_days = query.execute()
+        # Load the tasks of every previous day in one extra query instead of
+        # querying them day by day.
+        previous_days = prefetch(query, Task.select().order_by(Task.id.asc()))
 
         for previous_day in previous_days:
-            daily_tracker = DailyTracker(previous_day)
-            tasks = daily_tracker.get_tasks()
+            tasks = previous_day.tasks
 
             if not tasks:
                 continue
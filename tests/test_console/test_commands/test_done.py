@@ -4,6 +4,8 @@ import pytest
 
 from click.testing import CliRunner
 
+from hyperfocus.console.commands import _shortcodes
+from hyperfocus.services.daily_tracker import DailyTracker
 from hyperfocus.termui import icons
 
 
@@ -33,6 +35,11 @@ def test_done(cli):
     assert result.exit_code == 1
     assert result.output == expected
 
+    result = runner.invoke(cli, ["done", "1", "12"])
+
+    assert result.exit_code == 1
+    assert result.output == f"{icons.ERROR}(error) Task 12 does not exist.\n"
+
     result = runner.invoke(cli, ["done", "1"])
 
     assert result.exit_code == 0
@@ -46,3 +53,34 @@ def test_done(cli):
     assert result.output == (
         f"{icons.WARNING}(warning) Task: #1 {icons.TASK_STATUS} foo unchanged.\n"
     )
+
+
+@pytest.mark.functional
+def test_done_several_tasks(mocker, cli):
+    runner.invoke(cli, ["add", "foo"])
+    runner.invoke(cli, ["add", "bar"])
+    runner.invoke(cli, ["done", "2"])
+    echo = mocker.spy(_shortcodes.printer, "echo")
+
+    result = runner.invoke(cli, ["done", "1", "2"])
+
+    assert result.exit_code == 0
+    assert result.output == (
+        f"{icons.SUCCESS}(success) Task: #1 {icons.TASK_STATUS} foo done.\n"
+        f"{icons.WARNING}(warning) Task: #2 {icons.TASK_STATUS} bar unchanged.\n"
+    )
+    assert echo.call_count == 1
+
+
+@pytest.mark.functional
+def test_done_picked_task_is_not_fetched_again(mocker, cli):
+    runner.invoke(cli, ["add", "foo"])
+    get_tasks_by_ids = mocker.spy(DailyTracker, "get_tasks_by_ids")
+
+    result = runner.invoke(cli, ["done"], input="1\n")
+
+    assert result.exit_code == 0
+    assert result.output.endswith(
+        f"{icons.SUCCESS}(success) Task: #1 {icons.TASK_STATUS} foo done.\n"
+    )
+    get_tasks_by_ids.assert_not_called()
@@ -5,6 +5,7 @@ import pytest
 from click.testing import CliRunner
 from freezegun import freeze_time
 
+from hyperfocus.services.daily_tracker import DailyTracker
 from hyperfocus.termui import icons
 from tests.conftest import pytest_regex
 
@@ -49,3 +50,15 @@ def test_show(cli):
     )
     assert result.exit_code == 0
     assert expected == result.output
+
+
+@pytest.mark.functional
+def test_show_picked_task_is_not_fetched_again(mocker, cli):
+    runner.invoke(cli, ["add", "foo"])
+    get_tasks_by_ids = mocker.spy(DailyTracker, "get_tasks_by_ids")
+
+    result = runner.invoke(cli, ["show"], input="1\n")
+
+    assert result.exit_code == 0
+    assert "Title: foo\n" in result.output
+    get_tasks_by_ids.assert_not_called()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from peewee import Model
 
 from hyperfocus.database._database import Database
@@ -24,3 +26,22 @@ def test_database_with_models(test_dir):
     db_test.close()
     # close method returns 'is_open' db status if closed
     assert core_db_test.close() is False
+
+
+def test_database_atomic_rollback_on_error(test_dir):
+    test_db_path = test_dir / "test_atomic_db.sqlite"
+    db_test = Database()
+
+    class TestModel(Model):
+        class Meta:
+            database = db_test()
+
+    db_test.connect(test_db_path)
+    db_test.init_models([TestModel])
+
+    with pytest.raises(RuntimeError), db_test.atomic():
+        TestModel.create()
+        raise RuntimeError()
+
+    assert TestModel.select().count() == 0
+    db_test.close()
@@ -57,15 +57,20 @@ def test_daily_tracker_service_copy_task(test_database):
     assert copied_task.parent_task == task1
 
 
-def test_daily_tracker_service_get_task(test_database):
+def test_daily_tracker_service_get_tasks_by_ids(test_database):
     daily_tracker = DailyTracker.from_date(datetime.date(2022, 1, 2))
-    _task = daily_tracker.create_task(title="Test add task", details="Test add details")
+    task1 = daily_tracker.create_task(title="Test add task 1")
+    daily_tracker.create_task(title="Test add task 2")
+    task3 = daily_tracker.create_task(title="Test add task 3")
+    other_day = DailyTracker.from_date(datetime.date(2022, 1, 3))
+    other_day.create_task(title="Test add task 4")
+    other_day.create_task(title="Test add task 5")
 
-    task = daily_tracker.get_task(task_id=_task.id)
+    tasks = daily_tracker.get_tasks_by_ids([1, 3, 5])
 
-    assert task.id == _task.id
-    assert task.title == _task.title
-    assert task.details == _task.details
+    assert sorted(tasks) == [1, 3]
+    assert tasks[1].title == task1.title
+    assert tasks[3].title == task3.title
 
 
 def test_daily_tracker_service_get_tasks(test_database):
@@ -94,7 +99,7 @@ def test_daily_tracker_service_update_task(test_database):
 
     daily_tracker.update_task(task=_task, status=TaskStatus.DONE)
 
-    updated_task = daily_tracker.get_task(task_id=_task.id)
+    updated_task = daily_tracker.get_tasks_by_ids([_task.id])[_task.id]
     assert updated_task.status == TaskStatus.DONE
 
 
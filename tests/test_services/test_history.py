@@ -32,3 +32,20 @@ def test_history(test_database):
     assert isinstance(result[4][1], Task)
     assert result[5][0] is True
     assert isinstance(result[5][1], Task)
+
+
+def test_history_tasks_order(test_database):
+    daily_tracker = DailyTracker.from_date(datetime.date(2022, 2, 1))
+    daily_tracker.create_task("task1")
+    daily_tracker.create_task("task2")
+    daily_tracker = DailyTracker.from_date(datetime.date(2022, 2, 2))
+    daily_tracker.create_task("task3")
+    daily_tracker = DailyTracker.from_date(datetime.date(2022, 2, 3))
+    history = History(daily_tracker)
+
+    result = [data for _, data in history()]
+
+    assert result[0] == datetime.date(2022, 2, 2)
+    assert result[1].title == "task3"
+    assert result[2] == datetime.date(2022, 2, 1)
+    assert [task.title for task in result[3:]] == ["task1", "task2"]